@@ -1,56 +1,186 @@
 import requests
-from bs4 import BeautifulSoup
-import os
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import aiohttp
+import aiofiles
+import asyncio
+import lxml.etree
+import lxml.html
+from lxml.cssselect import CSSSelector
+import functools
+import contextlib
+import re
+import hashlib
+import shutil
 import urllib.parse
 import time
 import logging
+import threading
+import concurrent.futures
 from pathlib import Path
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Images smaller than this are written in one read instead of streamed
+_SMALL_IMAGE_BYTES = 512 * 1024
+_DOWNLOAD_CHUNK_BYTES = 128 * 1024
+
+# URLs matching this are skipped as icons or placeholders
+_SKIP_RE = re.compile(r'icon|logo|avatar|placeholder', re.IGNORECASE)
+
+# Compiled once at import; evaluating it walks the tree in C
+_IMG_XPATH = lxml.etree.XPath('//img')
+
+# Pagination selectors, compiled to XPath once instead of on every lookup
+_PAGINATION_SELECTORS = [CSSSelector(pattern, translator='html') for pattern in [
+    'a[href*="page/"]',
+    'a[href*="?page="]',
+    'a[href*="&page="]',
+    '.pagination a',
+    '.pager a',
+    'a:contains("Next")',
+    'a:contains(">")',
+    '[data-page]'
+]]
+
+_INFINITE_SCROLL_SELECTORS = [CSSSelector(pattern, translator='html') for pattern in [
+    '[data-infinite-scroll]',
+    '.infinite-scroll',
+    '[data-load-more]',
+    '.load-more'
+]]
+
+@functools.lru_cache(maxsize=4)
+def _parse(html_content, encoding=None):
+    """Parse HTML bytes into an lxml tree, reusing the tree when the same page is parsed again"""
+    parser = None
+    if encoding:
+        try:
+            parser = lxml.html.HTMLParser(encoding=encoding)
+        except LookupError:
+            logger.warning(f"Unknown charset {encoding!r}, falling back to the page's own declaration")
+    return lxml.html.fromstring(html_content, parser=parser)
+
+def _as_tree(document, encoding=None):
+    """Return a parsed tree for HTML content, passing already-parsed trees through"""
+    if lxml.etree.iselement(document):
+        return document
+    if not document:
+        return None
+    
+    # encoding is the HTTP header charset; without one lxml uses the page's <meta> declaration.
+    # lxml rejects str input that carries an encoding declaration, so hand it bytes
+    if isinstance(document, str):
+        document, encoding = document.encode('utf-8'), 'utf-8'
+    
+    try:
+        return _parse(document, encoding)
+    except lxml.etree.ParserError:
+        return None
+
+def _header_charset(headers):
+    """Return the charset declared in a Content-Type header, or None if there isn't one"""
+    # get_encoding_from_headers assumes ISO-8859-1 for text/* without a charset, which
+    # would override the page's <meta> declaration, so only use it when one is given
+    if 'charset=' not in headers.get('content-type', '').lower():
+        return None
+    return requests.utils.get_encoding_from_headers(headers)
+
 class AdsWorldScraper:
-    def __init__(self, base_url="https://www.adsoftheworld.com", download_dir="downloaded_images"):
+    def __init__(self, base_url="https://www.adsoftheworld.com", download_dir="downloaded_images",
+                 cache_name="ads_cache"):
         self.base_url = base_url
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(exist_ok=True)
         
-        # Session for connection pooling and maintaining cookies
-        self.session = requests.Session()
+        # Session for connection pooling and maintaining cookies; page responses are
+        # cached on disk and revalidated with ETag/Last-Modified so reruns skip unchanged pages
+        self.session = requests_cache.CachedSession(
+            cache_name,
+            backend='sqlite',
+            expire_after=3600,
+            cache_control=True
+        )
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            # Compressed HTML over reused connections; brotli must be installed for 'br'
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Connection': 'keep-alive',
+            'Accept': 'text/html,application/xhtml+xml,image/*,*/*;q=0.8'
         })
         
+        # Larger pool than the default 10 so concurrent downloads keep reusing connections
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         self.downloaded_count = 0
         self.failed_count = 0
         
+        # Image URLs already handed out for download, shared across pages
+        self.seen_urls = set()
+        
+        # Guards the counters and seen_urls when pages are scraped from worker threads
+        self.lock = threading.Lock()
+        
+        # Set on Ctrl+C so worker threads stop between images instead of finishing their pages
+        self.stop_event = threading.Event()
+        
+    def _page_url(self, page_num):
+        """Build the feed URL for a specific page"""
+        # Use the correct URL structure for adsoftheworld.com
+        return f"{self.base_url}/blog/feed?page={page_num}"
+    
+    def _make_page_dir(self, page_num):
+        """Create the page-specific download directory and return it"""
+        page_dir = self.download_dir / f"page_{page_num}"
+        page_dir.mkdir(exist_ok=True)
+        return page_dir
+    
+    def _image_filename(self, image_url):
+        """Derive a local filename from an image URL"""
+        # Plain string splits are much cheaper than a full urlparse per image
+        filename = image_url.split('#', 1)[0].split('?', 1)[0].rsplit('/', 1)[-1]
+        
+        # If no filename extension, add .jpg as default; the name comes from the URL
+        # so concurrent downloads on one page never pick the same fallback
+        if '.' not in filename or len(filename) < 5:
+            filename = f"image_{hashlib.sha1(image_url.encode()).hexdigest()[:16]}.jpg"
+        return filename
+    
     def get_page_content(self, page_num):
-        """Get the HTML content of a specific page"""
+        """Get a specific page parsed into an lxml tree, or None if it couldn't be fetched"""
         try:
-            # Use the correct URL structure for adsoftheworld.com
-            url = f"{self.base_url}/blog/feed?page={page_num}"
+            url = self._page_url(page_num)
             
             logger.info(f"Fetching page {page_num}: {url}")
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            return response.text
+            
+            # Raw bytes skip requests' charset detection; lxml decodes them in C
+            return _as_tree(response.content, _header_charset(response.headers))
         except requests.RequestException as e:
             logger.error(f"Error fetching page {page_num}: {e}")
             return None
     
-    def extract_image_urls(self, html_content):
-        """Extract all image URLs from the HTML content"""
-        if not html_content:
+    def extract_image_urls(self, document):
+        """Extract all image URLs from HTML content or an already-parsed tree"""
+        tree = _as_tree(document)
+        if tree is None:
             return []
         
-        soup = BeautifulSoup(html_content, 'html.parser')
-        image_urls = []
+        # Dict keys deduplicate while keeping the URLs in document order
+        image_urls = {}
         
         # Find all img tags
-        img_tags = soup.find_all('img')
-        
-        for img in img_tags:
+        for img in _IMG_XPATH(tree):
             # Get src or data-src attributes
             src = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
             
@@ -64,27 +194,25 @@ class AdsWorldScraper:
                     src = urllib.parse.urljoin(self.base_url, src)
                 
                 # Skip very small images (likely icons or thumbnails)
-                if any(skip_pattern in src.lower() for skip_pattern in ['icon', 'logo', 'avatar', 'placeholder']):
+                if _SKIP_RE.search(src):
                     continue
                     
-                image_urls.append(src)
+                image_urls.setdefault(src, None)
         
-        return list(set(image_urls))  # Remove duplicates
+        return list(image_urls)
+    
+    def _claim_new_urls(self, image_urls):
+        """Return the URLs not seen on earlier pages and mark them as seen"""
+        with self.lock:
+            to_download = [image_url for image_url in image_urls if image_url not in self.seen_urls]
+            self.seen_urls.update(to_download)
+        return to_download
     
-    def download_image(self, image_url, page_num):
-        """Download a single image"""
+    def download_image(self, image_url, page_dir):
+        """Download a single image into an existing page directory"""
         try:
             # Get filename from URL
-            parsed_url = urllib.parse.urlparse(image_url)
-            filename = os.path.basename(parsed_url.path)
-            
-            # If no filename extension, add .jpg as default
-            if '.' not in filename or len(filename) < 5:
-                filename = f"image_{self.downloaded_count + 1}.jpg"
-            
-            # Create page-specific directory
-            page_dir = self.download_dir / f"page_{page_num}"
-            page_dir.mkdir(exist_ok=True)
+            filename = self._image_filename(image_url)
             
             file_path = page_dir / filename
             
@@ -94,7 +222,9 @@ class AdsWorldScraper:
                 return True
             
             # Download image
-            response = self.session.get(image_url, timeout=30, stream=True)
+            # Images are already kept on disk, so don't duplicate them in the cache
+            response = self.session.get(image_url, timeout=30, stream=True,
+                                        expire_after=requests_cache.DO_NOT_CACHE)
             response.raise_for_status()
             
             # Check if it's actually an image
@@ -104,138 +234,377 @@ class AdsWorldScraper:
                 return False
             
             # Save image
-            with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            content_length = response.headers.get('Content-Length')
+            # Exclusive create so a filename collision fails instead of overwriting
+            with open(file_path, 'xb') as f:
+                if content_length and int(content_length) < _SMALL_IMAGE_BYTES:
+                    f.write(response.content)
+                else:
+                    # Copy in large chunks without a Python-level loop per chunk
+                    response.raw.decode_content = True
+                    shutil.copyfileobj(response.raw, f, length=_DOWNLOAD_CHUNK_BYTES)
             
-            self.downloaded_count += 1
-            logger.info(f"Downloaded: {filename} (Total: {self.downloaded_count})")
+            with self.lock:
+                self.downloaded_count += 1
+                total = self.downloaded_count
+            logger.info(f"Downloaded: {filename} (Total: {total})")
             return True
             
         except Exception as e:
-            self.failed_count += 1
+            with self.lock:
+                self.failed_count += 1
             logger.error(f"Failed to download {image_url}: {e}")
             return False
     
-    def detect_pagination_structure(self):
+    def detect_pagination_structure(self, document=None):
         """Detect the actual pagination structure of the website"""
         logger.info("Detecting pagination structure...")
         
-        # Get first page
-        html_content = self.get_page_content(1)
-        if not html_content:
+        # Get first page unless the caller already has it
+        if document is None:
+            document = self.get_page_content(1)
+        
+        tree = _as_tree(document)
+        if tree is None:
             return None
-            
-        soup = BeautifulSoup(html_content, 'html.parser')
         
         # Look for pagination links
-        pagination_patterns = [
-            'a[href*="page/"]',
-            'a[href*="?page="]', 
-            'a[href*="&page="]',
-            '.pagination a',
-            '.pager a',
-            'a:contains("Next")',
-            'a:contains(">")',
-            '[data-page]'
-        ]
-        
-        for pattern in pagination_patterns:
-            links = soup.select(pattern)
+        for selector in _PAGINATION_SELECTORS:
+            links = selector(tree)
             if links:
-                logger.info(f"Found pagination with pattern: {pattern}")
+                logger.info(f"Found pagination with pattern: {selector.css}")
                 for link in links[:5]:  # Check first 5 links
                     href = link.get('href')
                     if href:
                         logger.info(f"Pagination link found: {href}")
-                        return pattern
+                        return selector.css
         
         # Check for infinite scroll indicators
-        infinite_scroll_patterns = [
-            '[data-infinite-scroll]',
-            '.infinite-scroll',
-            '[data-load-more]',
-            '.load-more'
-        ]
-        
-        for pattern in infinite_scroll_patterns:
-            elements = soup.select(pattern)
+        for selector in _INFINITE_SCROLL_SELECTORS:
+            elements = selector(tree)
             if elements:
-                logger.info(f"Detected infinite scroll with pattern: {pattern}")
+                logger.info(f"Detected infinite scroll with pattern: {selector.css}")
                 return "infinite_scroll"
         
         logger.warning("No pagination structure detected")
         return None
     
-    def find_actual_page_count(self):
+    def page_exists(self, page_num):
+        """Check whether a page exists using only a HEAD request"""
+        url = self._page_url(page_num)
+        try:
+            # Page-count probes are stable, so cache them longer than page content
+            response = self.session.head(url, allow_redirects=True, timeout=10, expire_after=86400)
+        except requests.RequestException as e:
+            logger.error(f"Error probing page {page_num}: {e}")
+            return False
+        
+        return response.ok and response.headers.get('Content-Length') != '0'
+    
+    def page_has_images(self, page_num):
+        """Check whether a page exists by fetching it and looking for images"""
+        return bool(self.extract_image_urls(self.get_page_content(page_num)))
+    
+    def _search_last_page(self, probe, page_limit):
+        """Find the last page for which probe succeeds with exponential then binary search"""
+        # Double the page number until a probe fails to get an upper bound
+        last_good = 1
+        first_bad = 2
+        while probe(first_bad):
+            last_good = first_bad
+            if first_bad >= page_limit:
+                logger.warning(f"Reached page limit {page_limit} without finding the last page")
+                return page_limit
+            first_bad = min(first_bad * 2, page_limit)
+        
+        # Binary search between the last good and first bad page
+        while first_bad - last_good > 1:
+            mid_page = (last_good + first_bad) // 2
+            if probe(mid_page):
+                last_good = mid_page
+            else:
+                first_bad = mid_page
+        
+        return last_good
+    
+    def find_actual_page_count(self, page_limit=16384):
         """Find the actual number of pages available"""
         logger.info("Finding actual page count...")
         
-        # Start with a reasonable estimate
-        max_page = 1400
-        min_page = 1
+        # Cheap HEAD probes locate the boundary without downloading pages
+        last_page = self._search_last_page(self.page_exists, page_limit)
         
-        # Binary search to find the actual last page
-        while min_page < max_page:
-            mid_page = (min_page + max_page + 1) // 2
-            html_content = self.get_page_content(mid_page)
-            
-            if html_content and self.extract_image_urls(html_content):
-                min_page = mid_page
-            else:
-                max_page = mid_page - 1
+        # HEAD can't tell an empty page served with 200 from a real one, so confirm the
+        # boundary with page content and fall back to content probes if it doesn't hold
+        next_page_empty = last_page >= page_limit or not self.page_has_images(last_page + 1)
+        if not (self.page_has_images(last_page) and next_page_empty):
+            logger.warning("HEAD probes disagree with page content, searching by page content instead")
+            last_page = self._search_last_page(self.page_has_images, page_limit)
         
-        logger.info(f"Found actual page count: {min_page}")
-        return min_page
+        logger.info(f"Found actual page count: {last_page}")
+        return last_page
     
     def scrape_page(self, page_num):
         """Scrape a single page and download its images"""
-        html_content = self.get_page_content(page_num)
-        if not html_content:
+        tree = self.get_page_content(page_num)
+        if tree is None:
             return 0
         
-        image_urls = self.extract_image_urls(html_content)
-        logger.info(f"Found {len(image_urls)} images on page {page_num}")
+        image_urls = self.extract_image_urls(tree)
+        to_download = self._claim_new_urls(image_urls)
+        logger.info(f"Found {len(image_urls)} images on page {page_num}, {len(to_download)} new")
+        
+        if not to_download:
+            return 0
         
+        page_dir = self._make_page_dir(page_num)
         downloaded = 0
-        for image_url in image_urls:
-            if self.download_image(image_url, page_num):
+        for image_url in to_download:
+            if self.stop_event.is_set():
+                break
+            
+            if self.download_image(image_url, page_dir):
                 downloaded += 1
             
-            # Small delay to be respectful to the server
-            time.sleep(0.5)
+            # Small delay to be respectful to the server; returns early once stopping
+            self.stop_event.wait(0.5)
         
         return downloaded
     
-    def scrape_all_pages(self, start_page=1, end_page=1400):
-        """Scrape all pages from start_page to end_page"""
+    def scrape_all_pages(self, start_page=1, end_page=1400, max_workers=8):
+        """Scrape all pages from start_page to end_page using a pool of worker threads"""
         logger.info(f"Starting to scrape pages {start_page} to {end_page}")
         
+        total_pages = end_page - start_page + 1
+        completed = 0
+        self.stop_event.clear()
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.scrape_page, page_num): page_num
+                       for page_num in range(start_page, end_page + 1)}
+            
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    page_num = futures[future]
+                    completed += 1
+                    
+                    try:
+                        downloaded = future.result()
+                        logger.info(f"Page {page_num} completed. Downloaded {downloaded} images.")
+                    except Exception as e:
+                        logger.error(f"Unexpected error on page {page_num}: {e}")
+                    
+                    # Log progress every 50 pages, counting pages that errored too
+                    if completed % 50 == 0:
+                        logger.info(f"Progress: {completed}/{total_pages} pages completed. "
+                                  f"Total downloaded: {self.downloaded_count}, Failed: {self.failed_count}")
+                    
+            except KeyboardInterrupt:
+                logger.info("Scraping interrupted by user")
+                
+                # Drop queued pages and make running ones return after their current image
+                self.stop_event.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+        
+        logger.info(f"Scraping completed! Total downloaded: {self.downloaded_count}, Failed: {self.failed_count}")
+
+class AsyncRateLimiter:
+    """Token bucket that caps the aggregate request rate without blocking the event loop"""
+    
+    def __init__(self, rate=5, capacity=None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+        
+    async def acquire(self):
+        """Wait until a token is available and consume it"""
+        # The bucket is updated without awaiting, so no lock is needed on one event loop.
+        # A starved caller reserves its token by driving the balance negative, then sleeps
+        # until that debt is repaid; later callers queue up behind it.
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        self.tokens -= 1
+        
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+
+class AsyncAdsWorldScraper(AdsWorldScraper):
+    """Scraper that downloads images concurrently with aiohttp"""
+    
+    def __init__(self, base_url="https://www.adsoftheworld.com", download_dir="downloaded_images",
+                 cache_name="ads_cache", max_concurrent_downloads=8, requests_per_second=5):
+        super().__init__(base_url, download_dir, cache_name)
+        
+        # Caps in-flight image downloads to stay polite to the server; the semaphore
+        # itself is created per run, since asyncio primitives bind to one event loop
+        self.max_concurrent_downloads = max_concurrent_downloads
+        self.download_semaphore = None
+        
+        # Caps the combined rate of page and image requests; also created per run
+        self.requests_per_second = requests_per_second
+        self.rate_limiter = None
+        
+        # aiohttp session, opened for each run by _running
+        self.http = None
+        
+    def _client_session(self):
+        """Create an aiohttp session reusing the headers of the requests session"""
+        connector = aiohttp.TCPConnector(limit=50, limit_per_host=8)
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=dict(self.session.headers),
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+    
+    @contextlib.asynccontextmanager
+    async def _running(self):
+        """Open the session and per-run asyncio state inside the current event loop"""
+        async with self._client_session() as http:
+            self.http = http
+            self.download_semaphore = asyncio.Semaphore(self.max_concurrent_downloads)
+            self.rate_limiter = AsyncRateLimiter(self.requests_per_second)
+            try:
+                yield
+            finally:
+                # Don't leave a closed session or loop-bound state behind for the next run
+                self.http = None
+                self.download_semaphore = None
+                self.rate_limiter = None
+    
+    async def fetch_page_content(self, page_num):
+        """Get a specific page parsed into an lxml tree without blocking the event loop"""
+        await self.rate_limiter.acquire()
+        
+        # Pages go through the cached requests session in a worker thread, so reruns
+        # revalidate unchanged pages instead of downloading them again
+        return await asyncio.to_thread(self.get_page_content, page_num)
+    
+    async def download_image(self, image_url, page_dir):
+        """Download a single image into an existing page directory"""
+        async with self.download_semaphore:
+            try:
+                # Get filename from URL
+                filename = self._image_filename(image_url)
+                
+                file_path = page_dir / filename
+                
+                # Skip if file already exists
+                if file_path.exists():
+                    logger.info(f"Skipping existing file: {filename}")
+                    return True
+                
+                # Download image
+                await self.rate_limiter.acquire()
+                async with self.http.get(image_url) as response:
+                    response.raise_for_status()
+                    
+                    # Check if it's actually an image
+                    content_type = response.headers.get('content-type', '').lower()
+                    if not content_type.startswith('image/'):
+                        logger.warning(f"Skipping non-image content: {image_url}")
+                        return False
+                    
+                    data = await response.read()
+                
+                # Save image off the event loop so writes don't stall other downloads
+                # Exclusive create so a filename collision fails instead of overwriting
+                async with aiofiles.open(file_path, 'xb') as f:
+                    await f.write(data)
+                
+                self.downloaded_count += 1
+                logger.info(f"Downloaded: {filename} (Total: {self.downloaded_count})")
+                return True
+                
+            except Exception as e:
+                self.failed_count += 1
+                logger.error(f"Failed to download {image_url}: {e}")
+                return False
+    
+    async def scrape_page(self, page_num):
+        """Scrape a single page and download its images concurrently"""
+        # Called on its own rather than from scrape_all_pages, so open a session for this page
+        if self.http is None:
+            async with self._running():
+                return await self.scrape_page(page_num)
+        
+        tree = await self.fetch_page_content(page_num)
+        if tree is None:
+            return 0
+        
+        image_urls = self.extract_image_urls(tree)
+        to_download = self._claim_new_urls(image_urls)
+        logger.info(f"Found {len(image_urls)} images on page {page_num}, {len(to_download)} new")
+        
+        if not to_download:
+            return 0
+        
+        page_dir = self._make_page_dir(page_num)
+        
+        # If one download dies, the group cancels and awaits the rest before the session closes
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(self.download_image(image_url, page_dir)) for image_url in to_download]
+        return sum(task.result() for task in tasks)
+    
+    async def page_producer(self, queue, start_page, end_page, num_consumers):
+        """Fetch pages in order and queue their image URLs for the consumers"""
         for page_num in range(start_page, end_page + 1):
             try:
-                downloaded = self.scrape_page(page_num)
-                logger.info(f"Page {page_num} completed. Downloaded {downloaded} images.")
+                tree = await self.fetch_page_content(page_num)
+                image_urls = self.extract_image_urls(tree)
+                to_download = self._claim_new_urls(image_urls)
+                logger.info(f"Found {len(image_urls)} images on page {page_num}, {len(to_download)} new")
                 
-                # Longer delay between pages
-                time.sleep(2)
+                if to_download:
+                    page_dir = self._make_page_dir(page_num)
+                    
+                    # Blocks while the queue is full, so page fetches never run far ahead of downloads
+                    for image_url in to_download:
+                        await queue.put((image_url, page_dir))
                 
                 # Log progress every 50 pages
                 if page_num % 50 == 0:
-                    logger.info(f"Progress: {page_num}/{end_page} pages completed. "
+                    logger.info(f"Progress: {page_num}/{end_page} pages fetched. "
                               f"Total downloaded: {self.downloaded_count}, Failed: {self.failed_count}")
                 
-            except KeyboardInterrupt:
-                logger.info("Scraping interrupted by user")
-                break
             except Exception as e:
                 logger.error(f"Unexpected error on page {page_num}: {e}")
                 continue
         
+        # One sentinel per consumer signals that no more work is coming
+        for _ in range(num_consumers):
+            await queue.put(None)
+    
+    async def image_consumer(self, queue):
+        """Download queued images until a None sentinel is received"""
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            
+            image_url, page_dir = item
+            await self.download_image(image_url, page_dir)
+    
+    async def scrape_all_pages(self, start_page=1, end_page=1400, num_consumers=16, queue_size=500):
+        """Scrape all pages from start_page to end_page, overlapping page fetches with image downloads"""
+        logger.info(f"Starting to scrape pages {start_page} to {end_page}")
+        
+        async with self._running():
+            queue = asyncio.Queue(maxsize=queue_size)
+            
+            # A consumer that dies cancels the producer too, so it can't block forever on a
+            # full queue; cancelling the run stops every worker before the session closes
+            async with asyncio.TaskGroup() as group:
+                for _ in range(num_consumers):
+                    group.create_task(self.image_consumer(queue))
+                group.create_task(self.page_producer(queue, start_page, end_page, num_consumers))
+        
         logger.info(f"Scraping completed! Total downloaded: {self.downloaded_count}, Failed: {self.failed_count}")
 
 def main():
     # Create scraper instance
-    scraper = AdsWorldScraper()
+    scraper = AsyncAdsWorldScraper()
     
     print(f"Starting image scraper for adsoftheworld.com/blog/feed")
     print(f"Download directory: {scraper.download_dir}")
@@ -269,7 +638,7 @@ def main():
     print(f"Scraping pages {start_page} to {end_page}")
     
     try:
-        scraper.scrape_all_pages(start_page, end_page)
+        asyncio.run(scraper.scrape_all_pages(start_page, end_page))
     except KeyboardInterrupt:
         print("\nScraping stopped by user")
     